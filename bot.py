@@ -3,6 +3,7 @@ import contextlib
 import importlib.util
 import logging
 import logging.handlers
+import subprocess
 import sys
 from pathlib import Path
 from time import time
@@ -16,7 +17,7 @@ from jarowinkler import jarowinkler_similarity
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from database.models import Prefix
+from database.models import Prefix, Song
 from utils.config import config
 from utils.help import HelpCommand
 from utils.logging import QueueListenerHandler, console_handler, logger, setup_handler
@@ -30,6 +31,24 @@ if TYPE_CHECKING:
 BOT_DIR = Path(__file__).parent
 
 
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "describe", "--tags"],
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout.strip()
+    except FileNotFoundError:
+        return "unknown"
+
+    # vX.Y.Z-n-gHASH
+    if "-" in revision:
+        revision = "-".join(revision.split("-")[:2])
+
+    return revision or "unknown"
+
+
 class ChuniBot(commands.Bot):
     dev: bool = False
 
@@ -39,6 +58,10 @@ class ChuniBot(commands.Bot):
     launch_time: float
     app: Optional["Application"] = None
 
+    # Git revision, resolved once at startup since it cannot change
+    # while the bot is running.
+    revision: str
+
     # Prefix cache
     prefixes: dict[int, str]
 
@@ -46,10 +69,16 @@ class ChuniBot(commands.Bot):
     # value: userId, _t cookies from CHUNITHM-NET
     sessions: dict[int, tuple[str | None, str | None]]
 
+    # key: jacket filename (CHUNITHM-NET or zetaraku)
+    # value: song ID
+    jacket_to_song_id: dict[str, int]
+
     def __init__(self, *args, **kwargs):
         self.dev = config.dangerous.dev
         self.prefixes = {}
         self.sessions = {}
+        self.jacket_to_song_id = {}
+        self.revision = git_revision()
 
         super().__init__(*args, **kwargs)
 
@@ -65,6 +94,10 @@ class ChuniBot(commands.Bot):
 
         def setup_database(conn, _):
             conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
             conn.create_function("jwsim", 2, jarowinkler_similarity)
 
         sqlalchemy.event.listen(self.engine.sync_engine, "connect", setup_database)
@@ -76,6 +109,8 @@ class ChuniBot(commands.Bot):
         self.prefixes = {prefix.guild_id: prefix.prefix for prefix in prefixes}
         logger.info(f"Loaded {len(self.prefixes)} guild prefixes")
 
+        await self.refresh_jacket_cache()
+
         # Setup login web server (if enabled)
         if config.web.enable:
             self.app = init_app(
@@ -100,21 +135,56 @@ class ChuniBot(commands.Bot):
             await self.load_extension("cogs.hotreload")
             await self.load_extension("jishaku")
 
-        for file in (BOT_DIR / "cogs").glob("*.py"):
-            if file.stem in ("hotreload", "botutils", "__init__", "autocompleters"):
-                continue
-            try:
-                await self.load_extension(f"cogs.{file.stem}")
-                logger.info(f"Loaded extension cogs.{file.stem}")
-            except commands.errors.ExtensionAlreadyLoaded:
-                logger.warning(f"cogs.{file.stem} already loaded")
-            except commands.errors.NoEntryPointError:
-                logger.error(f"cogs.{file.stem} has no `setup` function.")
-            except commands.errors.ExtensionFailed as e:
+        # Extensions are mostly import-bound, so loading them concurrently
+        # brings cold-start time down to roughly the slowest cog instead of
+        # the sum of all of them.
+        extensions = [
+            f"cogs.{file.stem}"
+            for file in (BOT_DIR / "cogs").glob("*.py")
+            if file.stem not in ("hotreload", "botutils", "__init__", "autocompleters")
+        ]
+        results = await asyncio.gather(
+            *(self.load_extension(extension) for extension in extensions),
+            return_exceptions=True,
+        )
+        for extension, result in zip(extensions, results):
+            if result is None:
+                logger.info(f"Loaded extension {extension}")
+            elif isinstance(result, commands.errors.ExtensionAlreadyLoaded):
+                logger.warning(f"{extension} already loaded")
+            elif isinstance(result, commands.errors.NoEntryPointError):
+                logger.error(f"{extension} has no `setup` function.")
+            elif isinstance(result, commands.errors.ExtensionFailed):
+                logger.error(
+                    f"{extension} raised an error: {result.original.__class__.__name__}: {result.original}"
+                )
+            elif isinstance(result, BaseException):
                 logger.error(
-                    f"cogs.{file.stem} raised an error: {e.original.__class__.__name__}: {e.original}"
+                    f"{extension} raised an error: {result.__class__.__name__}: {result}"
                 )
 
+    async def refresh_jacket_cache(self) -> None:
+        """Rebuilds the jacket filename to song ID lookup.
+
+        The song catalogue only changes when the songs table is updated,
+        so commands can resolve jackets from this dict instead of querying
+        the database. Call this again after updating the songs table.
+        """
+        async with self.begin_db_session() as session:
+            rows = await session.execute(
+                select(Song.id, Song.jacket, Song.zetaraku_jacket)
+            )
+
+        jacket_to_song_id: dict[str, int] = {}
+        for song_id, jacket, zetaraku_jacket in rows:
+            if jacket:
+                jacket_to_song_id[jacket] = song_id
+            if zetaraku_jacket:
+                jacket_to_song_id[zetaraku_jacket] = song_id
+
+        self.jacket_to_song_id = jacket_to_song_id
+        logger.info(f"Cached {len(jacket_to_song_id)} jacket filenames")
+
     async def close(self) -> None:
         if self.app is not None:
             await self.app.shutdown()
@@ -151,19 +221,22 @@ async def startup():
         config=config,
     )
 
+    file_handler = setup_handler(
+        logging.handlers.RotatingFileHandler(
+            filename="discord.log",
+            encoding="utf-8",
+            maxBytes=32 * 1024 * 1024,  # 32 MiB
+            backupCount=5,  # Rotate through 5 files
+        ),
+    )
+    if not bot.dev:
+        # DEBUG logs to a rotating file are pure write amplification
+        # in production; the listener thread filters them out.
+        file_handler.setLevel(logging.INFO)
+
     discord.utils.setup_logging(
         level=logging.DEBUG if bot.dev else logging.INFO,
-        handler=QueueListenerHandler(
-            console_handler,
-            setup_handler(
-                logging.handlers.RotatingFileHandler(
-                    filename="discord.log",
-                    encoding="utf-8",
-                    maxBytes=32 * 1024 * 1024,  # 32 MiB
-                    backupCount=5,  # Rotate through 5 files
-                ),
-            ),
-        ),
+        handler=QueueListenerHandler(console_handler, file_handler),
         root=False,
     )
 
@@ -199,6 +272,12 @@ def sync_startup():
 
     if sys.version_info >= (3, 11):
         with asyncio.Runner(loop_factory=loop_factory) as runner:
+            if sys.version_info >= (3, 12):
+                # Eager tasks skip the scheduler round-trip for coroutines
+                # that complete without suspending (cache hits, cookie
+                # lookups, short DB fetches), which command paths fan out
+                # a lot of via asyncio.gather.
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
             runner.run(startup())
     else:
         if event_loop_impl is not None:
@@ -6,76 +6,104 @@ from bs4.element import ResultSet, Tag
 
 from .entities.enums import ClearType, Difficulty, Rank
 
+JST = ZoneInfo("Asia/Tokyo")
+
 
 def chuni_int(s: str) -> int:
     return int(s.replace(",", ""))
 
 
 def parse_player_rating(soup: ResultSet[Tag]) -> float:
-    rating = ""
+    parts = []
     for x in soup:
-        digit = extract_last_part(cast(str, x["src"]))
-        if digit == "comma":
-            rating += "."
-        else:
-            rating += digit[1]
-    return float(rating)
+        src: str = x["src"]  # type: ignore[reportGeneralTypeIssues]
+        last = src[src.rfind("_") + 1 : src.rfind(".")]
+        parts.append("." if last == "comma" else last[1])
+    return float("".join(parts))
 
 
 def parse_time(time: str, format: str = "%Y/%m/%d %H:%M") -> datetime:
-    return datetime.strptime(time, format).replace(tzinfo=ZoneInfo("Asia/Tokyo"))
+    if format == "%Y/%m/%d %H:%M":
+        # Hand-rolled parse for the format every record page uses;
+        # strptime re-compiles the format string on each call.
+        return datetime(
+            int(time[0:4]),
+            int(time[5:7]),
+            int(time[8:10]),
+            int(time[11:13]),
+            int(time[14:16]),
+            tzinfo=JST,
+        )
+    return datetime.strptime(time, format).replace(tzinfo=JST)
 
 
 def extract_last_part(url: str) -> str:
     return url.split("_")[-1].split(".")[0]
 
 
+_DIFFICULTY_FROM_IMGURL = {
+    "basic": Difficulty.BASIC,
+    "advanced": Difficulty.ADVANCED,
+    "expert": Difficulty.EXPERT,
+    "master": Difficulty.MASTER,
+    "worldsend": Difficulty.WORLDS_END,
+    "ultima": Difficulty.ULTIMA,
+    "ultimate": Difficulty.ULTIMA,
+}
+
+
 def difficulty_from_imgurl(url: str) -> Difficulty:
-    match extract_last_part(url):
-        case "basic":
-            return Difficulty.BASIC
-        case "advanced":
-            return Difficulty.ADVANCED
-        case "expert":
-            return Difficulty.EXPERT
-        case "master":
-            return Difficulty.MASTER
-        case "worldsend":
-            return Difficulty.WORLDS_END
-        case "ultima":
-            return Difficulty.ULTIMA
-        case "ultimate":
-            return Difficulty.ULTIMA
-
-        case _:
-            msg = f"Unknown difficulty: {url}"
-            raise ValueError(msg)
+    key = url.rpartition("_")[2].partition(".")[0]
+    try:
+        return _DIFFICULTY_FROM_IMGURL[key]
+    except KeyError:
+        msg = f"Unknown difficulty: {url}"
+        raise ValueError(msg) from None
 
 
 def get_rank_and_cleartype(soup: Tag) -> tuple[Rank, ClearType]:
-    if (rank_img_elem := soup.select_one("img[src*=_rank_]")) is not None:
-        rank_img_url = cast(str, rank_img_elem["src"])
-        rank = Rank(int(extract_last_part(rank_img_url)))
-    else:
-        rank = Rank.D
+    # This is called for every row of a record page, so walk the <img> tags
+    # once instead of running seven CSS selector traversals over the soup.
+    rank = Rank.D
+    has_clear = has_hard = has_absolutep = has_absolute = has_catastrophy = False
+    has_fullcombo = has_alljustice = False
+
+    for img in soup.find_all("img"):
+        src = cast(str, img.get("src", ""))
+        if "_rank_" in src:
+            rank = Rank(int(extract_last_part(src)))
+        if "clear" in src:
+            has_clear = True
+        if "hard" in src:
+            has_hard = True
+        if "absolutep" in src:
+            has_absolutep = True
+        if "absolute" in src:
+            has_absolute = True
+        if "catastrophy" in src:
+            has_catastrophy = True
+        if "fullcombo" in src:
+            has_fullcombo = True
+        if "alljustice" in src:
+            has_alljustice = True
 
     clear_type = ClearType.FAILED
-    if soup.select_one("img[src*=clear]") is not None:
+    if has_clear:
         clear_type = ClearType.CLEAR
-    elif soup.select_one("img[src*=hard]") is not None:
+    elif has_hard:
         clear_type = ClearType.HARD_CLEAR
-    elif soup.select_one("img[src*=absolutep]") is not None:
+    elif has_absolutep:
         clear_type = ClearType.ABSOLUTE_PLUS_CLEAR
-    elif soup.select_one("img[src*=absolute]") is not None:
+    elif has_absolute:
         clear_type = ClearType.ABSOLUTE_CLEAR
-    elif soup.select_one("img[src*=catastrophy]") is not None:
+    elif has_catastrophy:
         clear_type = ClearType.CATASTROPHY_CLEAR
 
     # FC and AJ should override all other lamps.
     if clear_type != ClearType.FAILED:
-        if soup.select_one("img[src*=fullcombo]") is not None:
+        if has_fullcombo:
             clear_type = ClearType.FULL_COMBO
-        elif soup.select_one("img[src*=alljustice]") is not None:
+        elif has_alljustice:
             clear_type = ClearType.ALL_JUSTICE
 
     return rank, clear_type
@@ -1,5 +1,6 @@
 import contextlib
-from typing import TYPE_CHECKING, Optional, overload
+from time import monotonic
+from typing import TYPE_CHECKING, Optional, Sequence, overload
 
 from discord.ext import commands
 from discord.ext.commands import Context
@@ -34,9 +35,38 @@ if TYPE_CHECKING:
 
 
 class UtilsCog(commands.Cog, name="Utils"):
+    # How long a cached CHUNITHM-NET client is reused before it is
+    # recreated, in seconds.
+    _CLIENT_TTL = 600.0
+
     def __init__(self, bot: "ChuniBot") -> None:
         self.bot = bot
 
+        # Cached CHUNITHM-NET clients with their expiry time, keyed by
+        # user discord ID. Reusing the client between commands keeps the
+        # authenticated session and its pooled connection alive instead
+        # of paying a TLS handshake on every invocation.
+        self._clients: dict[int, tuple[ChuniNet, float]] = {}
+
+        # Active chuninet() contexts per client, and clients evicted from
+        # the cache while still leased (e.g. held by an open
+        # RecentRecordsView); the last context to exit closes those.
+        self._client_leases: dict[ChuniNet, int] = {}
+        self._retired_clients: set[ChuniNet] = set()
+
+    async def cog_unload(self) -> None:
+        for client, _ in self._clients.values():
+            await self._retire_client(client)
+        self._clients.clear()
+
+    async def _retire_client(self, client: ChuniNet) -> None:
+        """Closes a client, deferring to its last active lease if it is
+        still being used by an open chuninet() context."""
+        if self._client_leases.get(client, 0) > 0:
+            self._retired_clients.add(client)
+        else:
+            await client.close()
+
     async def guild_prefix(self, ctx: Context) -> str:
         default_prefix: str = config.bot.default_prefix
         if ctx.guild is None:
@@ -66,13 +96,41 @@ class UtilsCog(commands.Cog, name="Utils"):
     async def chuninet(self, ctx_or_id: Context | int):
         id = ctx_or_id if isinstance(ctx_or_id, int) else ctx_or_id.author.id
         cookie = await self.login_check(ctx_or_id)
-        user_id, token = self.bot.sessions.get(id, (None, None))
 
-        session = ChuniNet(cookie, user_id=user_id, token=token)
+        session = None
+        if (cached := self._clients.get(id)) is not None:
+            session, expiry = cached
+            # Recreate the client if the user has logged in with a
+            # different cookie since it was cached. Don't close it here:
+            # another command (or an open view) may still be using it, so
+            # evict it and let the last holder close it.
+            if session.clal != cookie or monotonic() > expiry:
+                del self._clients[id]
+                await self._retire_client(session)
+                session = None
+
+        if session is None:
+            user_id, token = self.bot.sessions.get(id, (None, None))
+            session = ChuniNet(cookie, user_id=user_id, token=token)
+            self._clients[id] = (session, monotonic() + self._CLIENT_TTL)
+
+        self._client_leases[session] = self._client_leases.get(session, 0) + 1
         try:
             yield session
         finally:
-            await session.close()
+            remaining = self._client_leases.get(session, 1) - 1
+            if remaining > 0:
+                self._client_leases[session] = remaining
+            else:
+                self._client_leases.pop(session, None)
+
+            if session in self._retired_clients:
+                if remaining <= 0:
+                    self._retired_clients.discard(session)
+                    await session.close()
+            else:
+                self._clients[id] = (session, monotonic() + self._CLIENT_TTL)
+
             self.bot.sessions[id] = (session.user_id, session.token)
 
     @overload
@@ -94,37 +152,86 @@ class UtilsCog(commands.Cog, name="Utils"):
     async def annotate_song(
         self, song: Record | MusicRecord | RecentRecord | DetailedRecentRecord
     ) -> AnnotatedMusicRecord | AnnotatedRecentRecord | AnnotatedDetailedRecentRecord:
-        async with self.bot.begin_db_session() as session:
-            if isinstance(song, Record) and not isinstance(
-                song, (MusicRecord, DetailedRecentRecord, RecentRecord)
+        return (await self.annotate_songs([song]))[0]
+
+    async def annotate_songs(
+        self,
+        songs: Sequence[Record | MusicRecord | RecentRecord | DetailedRecentRecord],
+    ) -> list[AnnotatedMusicRecord | AnnotatedRecentRecord | AnnotatedDetailedRecentRecord]:
+        """Annotates scores with song and chart metadata from the database.
+
+        Unlike calling `annotate_song` once per score, all songs and charts
+        are resolved with a constant number of queries regardless of how
+        many scores are passed in.
+        """
+        ids: set[int] = set()
+        title_jackets: set[tuple[str, str]] = set()
+
+        for song in songs:
+            if isinstance(song, (MusicRecord, DetailedRecentRecord, RecentRecord)) and (
+                song.detailed is None or isinstance(song, RecentRecord)
             ):
+                title_jackets.add((song.title, song.jacket.split("/")[-1]))
+            else:
                 if song.detailed is None:
                     raise MissingDetailedParams
+                ids.add(song.detailed.idx)
 
-                stmt = select(Song).where(Song.id == song.detailed.idx)
-                song_data = (await session.execute(stmt)).scalar_one_or_none()
+        async with self.bot.begin_db_session() as session:
+            songs_by_id: dict[int, Song] = {}
+            songs_by_title_jacket: dict[tuple[str, str], Song] = {}
+
+            if ids:
+                stmt = select(Song).where(Song.id.in_(ids))
+                for song_data in (await session.execute(stmt)).scalars():
+                    songs_by_id[song_data.id] = song_data
+
+            if title_jackets:
+                stmt = select(Song).where(
+                    Song.title.in_({title for title, _ in title_jackets})
+                    & Song.jacket.in_({jacket for _, jacket in title_jackets})
+                )
+                for song_data in (await session.execute(stmt)).scalars():
+                    songs_by_title_jacket[
+                        (song_data.title, song_data.jacket)
+                    ] = song_data
+
+            song_ids = {song_data.id for song_data in songs_by_id.values()} | {
+                song_data.id for song_data in songs_by_title_jacket.values()
+            }
+
+            charts: dict[tuple[int, str], Chart] = {}
+            if song_ids:
+                stmt = select(Chart).where(Chart.song_id.in_(song_ids))
+                for chart_data in (await session.execute(stmt)).scalars():
+                    charts[(chart_data.song_id, chart_data.difficulty)] = chart_data
+
+        annotated_songs: list[
+            AnnotatedMusicRecord | AnnotatedRecentRecord | AnnotatedDetailedRecentRecord
+        ] = []
+        for song in songs:
+            if isinstance(song, Record) and not isinstance(
+                song, (MusicRecord, DetailedRecentRecord, RecentRecord)
+            ):
+                assert song.detailed is not None
 
+                song_data = songs_by_id.get(song.detailed.idx)
                 if song_data is None:
                     logger.warn(f"Missing song data for song ID {song.detailed.idx}")
-                    return AnnotatedMusicRecord(**song.__dict__)
-
-                id = song_data.id
+                    annotated_songs.append(AnnotatedMusicRecord(**song.__dict__))
+                    continue
 
                 annotated_song: AnnotatedMusicRecord = AnnotatedMusicRecord(
                     **song.__dict__, jacket=get_jacket_url(song_data)
                 )
                 annotated_song.rank = Rank.from_score(song.score)
             else:
-                stmt = select(Song)
                 if song.detailed is None or isinstance(song, RecentRecord):
-                    jacket_filename = song.jacket.split("/")[-1]
-                    stmt = stmt.where(
-                        (Song.title == song.title) & (Song.jacket == jacket_filename)
+                    song_data = songs_by_title_jacket.get(
+                        (song.title, song.jacket.split("/")[-1])
                     )
                 else:
-                    stmt = stmt.where(Song.id == song.detailed.idx)
-
-                song_data = (await session.execute(stmt)).scalar_one_or_none()
+                    song_data = songs_by_id.get(song.detailed.idx)
 
                 if isinstance(song, DetailedRecentRecord):
                     annotated_song = AnnotatedDetailedRecentRecord(**song.__dict__)
@@ -142,16 +249,24 @@ class UtilsCog(commands.Cog, name="Utils"):
                         logger.warn(
                             f"Missing song data for song ID {song.detailed.idx}"
                         )
-                    return annotated_song
-
-                id = song_data.id
+                    annotated_songs.append(annotated_song)
+                    continue
 
-            stmt = select(Chart).where(
-                (Chart.song_id == id)
-                & (Chart.difficulty == song.difficulty.short_form())
+            chart_data = charts.get((song_data.id, song.difficulty.short_form()))
+            annotated_songs.append(
+                self._annotate_chart_data(annotated_song, song, chart_data)
             )
-            chart_data = (await session.execute(stmt)).scalar_one_or_none()
 
+        return annotated_songs
+
+    def _annotate_chart_data(
+        self,
+        annotated_song: AnnotatedMusicRecord
+        | AnnotatedRecentRecord
+        | AnnotatedDetailedRecentRecord,
+        song: Record | MusicRecord | RecentRecord | DetailedRecentRecord,
+        chart_data: Chart | None,
+    ) -> AnnotatedMusicRecord | AnnotatedRecentRecord | AnnotatedDetailedRecentRecord:
         if chart_data is None:
             return annotated_song
         annotated_song.internal_level = chart_data.const
@@ -256,6 +371,7 @@ class UtilsCog(commands.Cog, name="Utils"):
         for cmd in self.bot.walk_commands():
             cmd.enabled = False
         # await update_db(self.bot.db)
+        await self.bot.refresh_jacket_cache()
         # Re-enable all commands
         for cmd in self.bot.walk_commands():
             cmd.enabled = True
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import sys
 from typing import TYPE_CHECKING, Literal, Optional
 
@@ -17,6 +18,10 @@ if TYPE_CHECKING:
     from bot import ChuniBot
     from cogs.botutils import UtilsCog
 
+USER_AGENT = f"ChuniBot (https://github.com/Rapptz/discord.py {discord.__version__}) Python/{sys.version_info[0]}.{sys.version_info[1]} aiohttp/{aiohttp.__version__}"
+
+REQUIRED_PERMISSIONS = frozenset({"submit_score", "customise_score"})
+
 
 class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": True}):
     def __init__(self, bot: "ChuniBot") -> None:
@@ -38,7 +43,24 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
 
         self.kt_client_id = kt_client_id
         self.kt_client_secret = kt_client_secret
-        self.user_agent = f"ChuniBot (https://github.com/Rapptz/discord.py {discord.__version__}) Python/{sys.version_info[0]}.{sys.version_info[1]} aiohttp/{aiohttp.__version__}"
+
+        # Shared session so requests to kamaitachi.xyz reuse pooled
+        # keep-alive connections instead of paying a TLS handshake each time.
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": USER_AGENT},
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+                json_serialize=json_dumps,
+            )
+        return self._session
+
+    async def cog_unload(self) -> None:
+        if self._session is not None:
+            await self._session.close()
 
     @commands.hybrid_group("kamaitachi", aliases=["kt"], invoke_without_command=True)
     async def kamaitachi(self, ctx: Context):
@@ -52,7 +74,7 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
         )
 
     async def _verify_and_login(self, token: str) -> Optional[str]:
-        async with aiohttp.ClientSession() as session, session.get(
+        async with self.session.get(
             "https://kamaitachi.xyz/api/v1/status",
             headers={
                 "Authorization": f"Bearer {token}",
@@ -66,8 +88,8 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
         if data["body"]["whoami"] is None:
             return "The provided API token is not bound to any user."
 
-        permissions = data["body"]["permissions"]
-        if "submit_score" not in permissions or "customise_score" not in permissions:
+        permissions = set(data["body"]["permissions"])
+        if not REQUIRED_PERMISSIONS.issubset(permissions):
             return (
                 "The provided API token is missing permissions.\n"
                 "Ensure that the token has permissions `submit_score` and `customise_score`"
@@ -77,52 +99,54 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
 
     @kamaitachi.command("link", aliases=["login"])
     async def kamaitachi_link(self, ctx: Context, token: Optional[str] = None):
+        # One session for both the lookup and the token write; the cookie
+        # stays attached, so updating it only needs a commit instead of a
+        # second session + merge.
         async with self.bot.begin_db_session() as session:
             query = select(Cookie).where(Cookie.discord_id == ctx.author.id)
             cookie = (await session.execute(query)).scalar_one_or_none()
 
-        if cookie is None:
-            return await ctx.reply(
-                content="Please login with `c>login` first before linking with Kamaitachi.",
-                mention_author=False,
-            )
-
-        channel = (
-            ctx.author.dm_channel
-            if ctx.author.dm_channel
-            else await ctx.author.create_dm()
-        )
-        if not isinstance(ctx.channel, discord.channel.DMChannel):
-            please_delete_message = ""
-            if token is not None:
-                try:
-                    await ctx.message.delete()
-                except discord.errors.Forbidden:
-                    please_delete_message = "Please delete the original command. Why are you exposing your API keys?"
-
-            await ctx.send(
-                f"Login instructions have been sent to your DMs. {please_delete_message}"
-                "(please **enable Privacy Settings -> Direct Messages** if you haven't received it.)"
-            )
-        elif token is not None:
-            result = await self._verify_and_login(token)
-            if result is not None:
-                raise commands.BadArgument(result)
+            if cookie is None:
+                return await ctx.reply(
+                    content="Please login with `c>login` first before linking with Kamaitachi.",
+                    mention_author=False,
+                )
 
-            cookie.kamaitachi_token = token
-            async with self.bot.begin_db_session() as session, session.begin():
-                await session.merge(cookie)
-
-            return await ctx.reply(
-                content=(
-                    "Successfully linked with Kamaitachi.\n"
-                    "You can now use `c>kamaitachi sync` to sync your recent scores.\n"
-                    "\n"
-                    "**It is recommended that you run `c>kamaitachi sync pb` to sync your personal bests first, "
-                    "before syncing your recent scores.**"
-                ),
-                mention_author=False,
+            channel = (
+                ctx.author.dm_channel
+                if ctx.author.dm_channel
+                else await ctx.author.create_dm()
             )
+            if not isinstance(ctx.channel, discord.channel.DMChannel):
+                please_delete_message = ""
+                if token is not None:
+                    try:
+                        await ctx.message.delete()
+                    except discord.errors.Forbidden:
+                        please_delete_message = "Please delete the original command. Why are you exposing your API keys?"
+
+                await ctx.send(
+                    f"Login instructions have been sent to your DMs. {please_delete_message}"
+                    "(please **enable Privacy Settings -> Direct Messages** if you haven't received it.)"
+                )
+            elif token is not None:
+                result = await self._verify_and_login(token)
+                if result is not None:
+                    raise commands.BadArgument(result)
+
+                cookie.kamaitachi_token = token
+                await session.commit()
+
+                return await ctx.reply(
+                    content=(
+                        "Successfully linked with Kamaitachi.\n"
+                        "You can now use `c>kamaitachi sync` to sync your recent scores.\n"
+                        "\n"
+                        "**It is recommended that you run `c>kamaitachi sync pb` to sync your personal bests first, "
+                        "before syncing your recent scores.**"
+                    ),
+                    mention_author=False,
+                )
 
         embed = discord.Embed(
             title="Link with Kamaitachi",
@@ -149,14 +173,13 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
             query = select(Cookie).where(Cookie.discord_id == ctx.author.id)
             cookie = (await session.execute(query)).scalar_one_or_none()
 
-        if cookie is None or cookie.kamaitachi_token is None:
-            return await ctx.reply(
-                content="You are not linked with Kamaitachi.", mention_author=False
-            )
+            if cookie is None or cookie.kamaitachi_token is None:
+                return await ctx.reply(
+                    content="You are not linked with Kamaitachi.", mention_author=False
+                )
 
-        cookie.kamaitachi_token = None
-        async with self.bot.begin_db_session() as session:
-            await session.merge(cookie)
+            cookie.kamaitachi_token = None
+            await session.commit()
 
         return await ctx.reply(
             content="Successfully unlinked with Kamaitachi.", mention_author=False
@@ -206,40 +229,48 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
             await client.authenticate()
 
             if sync == "recent":
-                recents = await client.recent_record()
-                for recent in recents:
+                recents = [
+                    recent
+                    for recent in await client.recent_record()
+                    if recent.detailed is not None
+                ]
+
+                # The detail fetches are independent requests, so overlap
+                # them instead of paying one round-trip per score. The
+                # semaphore keeps us from hammering CHUNITHM-NET.
+                semaphore = asyncio.Semaphore(5)
+
+                async def fetch_detailed(idx: int):
+                    async with semaphore:
+                        return await client.detailed_recent_record(idx)
+
+                detailed_recents = await asyncio.gather(
+                    *(
+                        fetch_detailed(recent.detailed.idx)  # type: ignore[reportOptionalMemberAccess]
+                        for recent in recents
+                    )
+                )
+
+                for recent, detailed_recent in zip(recents, detailed_recents):
+                    if detailed_recent.detailed is None:
+                        continue
+
                     score_data = {
                         "score": recent.score,
                         "lamp": self._tachi_lamp(recent.clear),
                         "matchType": "inGameID",
-                        "identifier": "",
+                        "identifier": str(detailed_recent.detailed.idx),
                         "difficulty": str(recent.difficulty),
                         "timeAchieved": int(recent.date.timestamp()) * 1000,
-                        "judgements": {},
-                        "hitMeta": {},
+                        "judgements": {
+                            "jcrit": detailed_recent.judgements.jcrit,
+                            "justice": detailed_recent.judgements.justice,
+                            "attack": detailed_recent.judgements.attack,
+                            "miss": detailed_recent.judgements.miss,
+                        },
+                        "hitMeta": {"maxCombo": detailed_recent.max_combo},
                     }
 
-                    if recent.detailed is None:
-                        continue
-
-                    detailed_recent = await client.detailed_recent_record(
-                        recent.detailed.idx
-                    )
-
-                    if detailed_recent.detailed is None:
-                        continue
-
-                    score_data["identifier"] = str(detailed_recent.detailed.idx)
-
-                    score_data["judgements"]["jcrit"] = detailed_recent.judgements.jcrit
-                    score_data["judgements"][
-                        "justice"
-                    ] = detailed_recent.judgements.justice
-                    score_data["judgements"][
-                        "attack"
-                    ] = detailed_recent.judgements.attack
-                    score_data["judgements"]["miss"] = detailed_recent.judgements.miss
-
                     if (
                         detailed_recent.judgements.justice == 0
                         and detailed_recent.judgements.attack == 0
@@ -247,8 +278,6 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
                     ):
                         score_data["lamp"] = "ALL JUSTICE CRITICAL"
 
-                    score_data["hitMeta"]["maxCombo"] = detailed_recent.max_combo
-
                     scores.append(score_data)
             elif sync == "pb":
                 for difficulty in Difficulty:
@@ -281,14 +310,11 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
                 "scores": scores,
             }
 
-            async with aiohttp.ClientSession(
-                json_serialize=json_dumps
-            ) as session, session.post(
+            async with self.session.post(
                 "https://kamaitachi.xyz/ir/direct-manual/import",
                 json=request_body,
                 headers={
                     "Authorization": f"Bearer {cookie.kamaitachi_token}",
-                    "Content-Type": "application/json",
                     "X-User-Intent": "true",
                 },
             ) as resp:
@@ -300,14 +326,19 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
                     )
                 poll_url = data["body"]["url"]
 
+            # Poll aggressively at first so fast imports finish visibly
+            # sooner, then back off to avoid hammering the API.
+            delay = 0.5
+            last_progress = None
             while True:
-                async with aiohttp.ClientSession() as session, session.get(
+                async with self.session.get(
                     poll_url,
                     headers={
                         "Authorization": f"Bearer {cookie.kamaitachi_token}",
                     },
                 ) as resp:
                     data = await resp.json(loads=json_loads)
+                    retry_after = resp.headers.get("Retry-After")
 
                 if not data["success"]:
                     return await message.edit(
@@ -315,13 +346,21 @@ class KamaitachiCog(commands.Cog, name="Kamaitachi", command_attrs={"hidden": Tr
                     )
 
                 if data["body"]["importStatus"] == "ongoing":
-                    await message.edit(
-                        content=(
-                            f"Importing scores: {data['description']}\n"
-                            f"Progress: {data['body']['progress']['description']}"
+                    progress = data["body"]["progress"]["description"]
+                    if progress != last_progress:
+                        last_progress = progress
+                        await message.edit(
+                            content=(
+                                f"Importing scores: {data['description']}\n"
+                                f"Progress: {progress}"
+                            )
                         )
-                    )
-                    await asyncio.sleep(2)
+
+                    if retry_after is not None:
+                        with contextlib.suppress(ValueError):
+                            delay = max(delay, float(retry_after))
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 5.0)
                     continue
 
                 if data["body"]["importStatus"] == "completed":
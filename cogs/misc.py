@@ -1,4 +1,3 @@
-import asyncio
 import platform
 import time
 from random import random
@@ -17,12 +16,32 @@ if TYPE_CHECKING:
     from bot import ChuniBot
     from cogs.botutils import UtilsCog
 
+SOURCE_URL = "<https://github.com/beerpiss/chuninewbot>"
+ARMSTRONG_URL = "https://tenor.com/view/metal-gear-rising-metal-gear-rising-revengeance-senator-armstrong-revengeance-i-made-it-the-fuck-up-gif-25029602"
+
+INVITE_PERMISSIONS = discord.Permissions(
+    read_messages=True,
+    send_messages=True,
+    send_messages_in_threads=True,
+    manage_messages=True,
+    read_message_history=True,
+)
+
 
 class MiscCog(commands.Cog, name="Miscellaneous"):
+    # How long the botinfo user count is cached, in seconds.
+    _USER_COUNT_TTL = 300.0
+
     def __init__(self, bot: "ChuniBot") -> None:
         self.bot = bot
         self.utils: "UtilsCog" = self.bot.get_cog("Utils")  # type: ignore[reportGeneralTypeIssues]
 
+        # (time the count was taken, count)
+        self._user_count_cache: Optional[tuple[float, int]] = None
+
+        # Built lazily since bot.user is only known after login.
+        self._invite_url: Optional[str] = None
+
     @commands.command("treesync", hidden=True, invoke_without_command=True)
     @commands.is_owner()
     async def sync(
@@ -67,11 +86,7 @@ class MiscCog(commands.Cog, name="Miscellaneous"):
     async def source(self, ctx: Context):
         """Get the source code for this bot."""
 
-        reply = (
-            "https://tenor.com/view/metal-gear-rising-metal-gear-rising-revengeance-senator-armstrong-revengeance-i-made-it-the-fuck-up-gif-25029602"
-            if random() < 0.1
-            else "<https://github.com/beerpiss/chuninewbot>"
-        )
+        reply = ARMSTRONG_URL if random() < 0.1 else SOURCE_URL
 
         await ctx.reply(reply, mention_author=False)
 
@@ -79,15 +94,10 @@ class MiscCog(commands.Cog, name="Miscellaneous"):
     async def invite(self, ctx: Context):
         """Invite this bot to your server!"""
 
-        permissions = discord.Permissions(
-            read_messages=True,
-            send_messages=True,
-            send_messages_in_threads=True,
-            manage_messages=True,
-            read_message_history=True,
-        )
+        if self._invite_url is None:
+            self._invite_url = oauth_url(self.bot.user.id, permissions=INVITE_PERMISSIONS)  # type: ignore[reportGeneralTypeIssues]
 
-        await ctx.reply(oauth_url(self.bot.user.id, permissions=permissions), mention_author=False)  # type: ignore[reportGeneralTypeIssues]
+        await ctx.reply(self._invite_url, mention_author=False)
 
     @commands.hybrid_command("botinfo")
     async def botinfo(self, ctx: Context):
@@ -106,27 +116,19 @@ class MiscCog(commands.Cog, name="Miscellaneous"):
         if self.bot.user is not None and self.bot.user.avatar is not None:
             embed.set_thumbnail(url=self.bot.user.avatar.url)
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "describe",
-                "--tags",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await process.communicate()
-            revision = stdout.decode("utf-8").replace("\n", "")
-
-            # vX.Y.Z-n-gHASH
-            if "-" in revision:
-                revision = "-".join(revision.split("-")[:2])
-        except FileNotFoundError:
-            revision = "unknown"
-        if not revision:
-            revision = "unknown"
-
-        async with self.bot.begin_db_session() as session:
-            users = await session.scalar(select(func.count()).select_from(Cookie))
+        revision = self.bot.revision
+
+        # The count is a full table scan on SQLite, and it barely changes;
+        # serve a slightly stale value instead of scanning per invocation.
+        if (
+            self._user_count_cache is not None
+            and time.monotonic() - self._user_count_cache[0] < self._USER_COUNT_TTL
+        ):
+            users = self._user_count_cache[1]
+        else:
+            async with self.bot.begin_db_session() as session:
+                users = await session.scalar(select(func.count()).select_from(Cookie))
+            self._user_count_cache = (time.monotonic(), users or 0)
 
         embed.add_field(name="Version", value=revision)
         embed.add_field(
@@ -49,8 +49,7 @@ class RecordsCog(commands.Cog, name="Records"):
             userinfo = await client.authenticate()
             recent_scores = await client.recent_record()
 
-            tasks = [self.utils.annotate_song(score) for score in recent_scores]
-            recent_scores = await asyncio.gather(*tasks)
+            recent_scores = await self.utils.annotate_songs(recent_scores)
 
             view = RecentRecordsView(
                 ctx, self.bot, recent_scores, client, ctxmgr, userinfo
@@ -86,24 +85,24 @@ class RecordsCog(commands.Cog, name="Records"):
                     cast(int, ctx.message.reference.message_id)
                 )
             else:
-                bot_messages: list[discord.Message] = [
-                    message
-                    async for message in ctx.channel.history(limit=50)
-                    if message.author == self.bot.user
-                    and any(
+                # Only the most recent match is used, so stop at the first
+                # hit instead of paginating through all 50 messages.
+                message = None
+                async for candidate in ctx.channel.history(limit=50):
+                    if candidate.author == self.bot.user and any(
                         x.thumbnail.url is not None
                         and (
                             JACKET_BASE in x.thumbnail.url
                             or INTERNATIONAL_JACKET_BASE in x.thumbnail.url
                         )
-                        for x in message.embeds
-                    )
-                ]
-                if len(bot_messages) == 0:
+                        for x in candidate.embeds
+                    ):
+                        message = candidate
+                        break
+                if message is None:
                     return await ctx.reply(
                         "No recent scores found.", mention_author=False
                     )
-                message = bot_messages[0]
 
             embeds = [
                 x
@@ -147,17 +146,13 @@ class RecordsCog(commands.Cog, name="Records"):
 
             thumbnail_filename = cast(str, embed.thumbnail.url).split("/")[-1]
 
-            stmt = select(Song).where(
-                (Song.jacket == thumbnail_filename)
-                | (Song.zetaraku_jacket == thumbnail_filename)
-            )
-            song = (await session.execute(stmt)).scalar_one_or_none()
-            if song is None:
+            song_id = self.bot.jacket_to_song_id.get(thumbnail_filename)
+            if song_id is None:
                 await ctx.reply("No song found.", mention_author=False)
                 return None
 
             userinfo = await client.authenticate()
-            records = await client.music_record(song.id)
+            records = await client.music_record(song_id)
 
             if len(records) == 0:
                 await ctx.reply(
@@ -0,0 +1,31 @@
+"""add index on chunirec_songs.jacket
+
+`compare` resolves embed thumbnails back to songs by jacket filename,
+which was a full table scan without this index.
+
+Revision ID: f3b2a90c41d7
+Revises: 8cd5df7f3bb4
+Create Date: 2026-08-26 10:42:17.384206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b2a90c41d7"
+down_revision: Union[str, None] = "8cd5df7f3bb4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("chunirec_songs", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_chunirec_songs_jacket"), ["jacket"], unique=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("chunirec_songs", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_chunirec_songs_jacket"))
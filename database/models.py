@@ -43,7 +43,7 @@ class Song(Base):
     release: Mapped[str] = mapped_column(nullable=False)
     bpm: Mapped[Optional[int]] = mapped_column(nullable=True)
 
-    jacket: Mapped[str] = mapped_column(nullable=False)
+    jacket: Mapped[str] = mapped_column(nullable=False, index=True)
     zetaraku_jacket: Mapped[str] = mapped_column(nullable=False)
 
     international_only: Mapped[bool] = mapped_column(nullable=False)
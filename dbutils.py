@@ -1,18 +1,20 @@
 # ruff: noqa: RUF001
 
 import argparse
+import asyncio
 import csv
 import importlib.util
 import logging
 import re
+from functools import lru_cache
 from html import unescape
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, TypedDict
-from xml.etree import ElementTree
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional, TypedDict
 
 import aiohttp
-from bs4 import BeautifulSoup
-from bs4.element import Comment
+import lxml.html
+from lxml import etree
 from sqlalchemy import func, select
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import (
@@ -109,7 +111,9 @@ CHUNITHM_CATCODES = {
     "ORIGINAL": 5,
 }
 
-MANUAL_MAPPINGS: dict[str, dict[str, str]] = {
+# Read-only: built once at import and safe to share with worker threads
+# or processes.
+MANUAL_MAPPINGS: Mapping[str, dict[str, str]] = MappingProxyType({
     "7a561ab609a0629d": {  # Trackless wilderness【狂】
         "id": "8227",
         "catname": "ORIGINAL",
@@ -150,27 +154,73 @@ MANUAL_MAPPINGS: dict[str, dict[str, str]] = {
         "we_star": "7",
         "image": "43bd6cbc31e4c02c.jpg",
     },
+    **{
+        random_id: {
+            "id": str(8244 + idx),
+            "catname": "VARIETY",
+            "title": "Random",
+            "we_kanji": f"分{chr(65 + idx)}",
+            "we_star": "5",
+            "image": random_image,
+        }
+        for idx, (random_id, random_image) in enumerate(
+            # Random WE, A through F
+            [
+                ("d8b8af2016eec2f0", "97af9ed62e768d73.jpg"),
+                ("5a0bc7702113a633", "fd4a488ed2bc67d8.jpg"),
+                ("948e0c4b67f4269d", "ce911dfdd8624a7c.jpg"),
+                ("56e583c091b4295c", "6a3201f1b63ff9a3.jpg"),
+                ("49794fec968b90ba", "d43ab766613ba19e.jpg"),
+                ("b9df9d9d74b372d9", "4a359278c6108748.jpg"),
+            ]
+        )
+    },
+})
+
+# Compiled XPaths for scraping sdvx.in; XPath evaluation happens in C
+# instead of SoupSieve re-walking the tree per select() call.
+TABLE_XPATH = etree.XPath(
+    "//table[.//td[contains(concat(' ', normalize-space(@class), ' '), ' tbgl ')]]"
+)
+SCRIPT_XPATH = etree.XPath(".//script[@src]")
+# The song title lives in an HTML comment right after the chart script.
+COMMENT_XPATH = etree.XPath("./following::comment()[1]")
+
+# Compiled XPaths for the Music.xml files in game data dumps.
+MUSIC_ID_XPATH = etree.XPath("./name/id/text()")
+MUSIC_FUMENS_XPATH = etree.XPath("./fumens/MusicFumenData[enable='true']")
+MUSIC_WE_TAG_XPATH = etree.XPath("./worldsEndTagName/str/text()")
+MUSIC_WE_STARS_XPATH = etree.XPath("./starDifType/text()")
+FUMEN_TYPE_XPATH = etree.XPath("./type/data/text()")
+FUMEN_LEVEL_XPATH = etree.XPath("./level/text()")
+FUMEN_LEVEL_DECIMAL_XPATH = etree.XPath("./levelDecimal/text()")
+FUMEN_FILE_XPATH = etree.XPath("./file/path/text()")
+
+# Chart CSV command -> Chart column, for the integer note/judge counts.
+CHART_CSV_ATTRS = {
+    "T_JUDGE_ALL": "maxcombo",
+    "T_JUDGE_TAP": "tap",
+    "T_JUDGE_HLD": "hold",
+    "T_JUDGE_SLD": "slide",
+    "T_JUDGE_AIR": "air",
+    "T_JUDGE_FLK": "flick",
 }
-for idx, random in enumerate(
-    # Random WE, A through F
-    [
-        ("d8b8af2016eec2f0", "97af9ed62e768d73.jpg"),
-        ("5a0bc7702113a633", "fd4a488ed2bc67d8.jpg"),
-        ("948e0c4b67f4269d", "ce911dfdd8624a7c.jpg"),
-        ("56e583c091b4295c", "6a3201f1b63ff9a3.jpg"),
-        ("49794fec968b90ba", "d43ab766613ba19e.jpg"),
-        ("b9df9d9d74b372d9", "4a359278c6108748.jpg"),
-    ]
-):
-    random_id, random_image = random
-    MANUAL_MAPPINGS[random_id] = {
-        "id": str(8244 + idx),
-        "catname": "VARIETY",
-        "title": "Random",
-        "we_kanji": f"分{chr(65 + idx)}",
-        "we_star": "5",
-        "image": random_image,
+
+# Single-character normalizations folded into one translate() table, so
+# normalize_title makes a single C-level pass instead of one scan (and
+# one intermediate string) per .replace() call. Only actual rewrites are
+# listed; the old .replace() chain also carried identity no-ops.
+_NORMALIZE_TABLE = str.maketrans(
+    {
+        "　": " ",
+        "`": "'",
+        "”": '"',
+        "“": '"',
     }
+)
+
+# An existence check for an anchor tag doesn't need a parse tree.
+A_TAG_REGEX = re.compile(r"<a[\s>]", re.IGNORECASE)
 
 WORLD_END_REGEX = re.compile(r"【(.{1,2})】$", re.MULTILINE)
 WORLD_END_SDVXIN_REGEX = re.compile(
@@ -178,71 +228,80 @@ WORLD_END_SDVXIN_REGEX = re.compile(
 )
 
 
+# SQLite caps both statement length and the number of bound variables,
+# and a single multi-thousand-row VALUES clause is slow to parse anyway.
+UPSERT_PAGE_SIZE = 500
+
+
+def chunked(rows: list, size: int = UPSERT_PAGE_SIZE):
+    """Yield successive pages of at most `size` rows."""
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+@lru_cache(maxsize=None)
 def normalize_title(title: str, *, remove_we_kanji: bool = False) -> str:
-    title = (
-        title.lower()
-        .replace(" ", " ")
-        .replace("　", " ")
-        .replace(" ", " ")
-        .replace(":", ":")
-        .replace("(", "(")
-        .replace(")", ")")
-        .replace("!", "!")
-        .replace("?", "?")
-        .replace("`", "'")
-        .replace("`", "'")
-        .replace("”", '"')
-        .replace("“", '"')
-        .replace("~", "~")
-        .replace("-", "-")
-        .replace("@", "@")
-    )
+    # Fast path: ASCII titles can't contain the WE kanji brackets, and
+    # the backtick is the only ASCII character the table rewrites.
+    if title.isascii() and "`" not in title:
+        return title.lower()
+
+    title = title.lower().translate(_NORMALIZE_TABLE)
     if remove_we_kanji:
         title = WORLD_END_REGEX.sub("", title)
     return title
 
 
-async def update_aliases(async_session: async_sessionmaker[AsyncSession]):
-    async with aiohttp.ClientSession() as client, async_session() as session, session.begin():
+async def update_aliases(
+    async_session: async_sessionmaker[AsyncSession], client: aiohttp.ClientSession
+):
+    async with async_session() as session, session.begin():
         resp = await client.get(
             "https://github.com/lomotos10/GCM-bot/raw/main/data/aliases/en/chuni.tsv"
         )
         aliases = [x.split("\t") for x in (await resp.text()).splitlines()]
 
+        # One SELECT indexed by title instead of one round-trip per alias
+        # line. Limit to non-WE entries; WE entries are redirected to
+        # their non-WE respectives when song-searching anyways.
+        rows = await session.execute(
+            select(Song.id, Song.title).where(Song.id < 8000)
+        )
+        title_to_id = {row.title: row.id for row in rows}
+
         inserted_aliases = []
         for alias in aliases:
             if len(alias) < 2:
                 continue
-            title = alias[0]
-
-            song = (
-                await session.execute(
-                    select(Song)
-                    # Limit to non-WE entries. WE entries are redirected to
-                    # their non-WE respectives when song-searching anyways.
-                    .where((Song.title == title) & (Song.id < 8000))
-                )
-            ).scalar_one_or_none()
-            if song is None:
+
+            song_id = title_to_id.get(alias[0])
+            if song_id is None:
                 continue
 
             inserted_aliases.extend(
                 [
-                    {"alias": x, "guild_id": -1, "song_id": song.id, "owner_id": None}
+                    {"alias": x, "guild_id": -1, "song_id": song_id, "owner_id": None}
                     for x in alias[1:]
                 ]
             )
 
-        insert_statement = insert(Alias).values(inserted_aliases)
+        if not inserted_aliases:
+            return
+
+        # Statement built once; executemany re-binds parameters per page
+        # instead of recompiling the conflict clause for every batch.
+        insert_statement = insert(Alias)
         upsert_statement = insert_statement.on_conflict_do_update(
             index_elements=[Alias.alias, Alias.guild_id],
             set_={"song_id": insert_statement.excluded.song_id},
         )
-        await session.execute(upsert_statement)
+        for batch in chunked(inserted_aliases):
+            await session.execute(upsert_statement, batch)
 
 
-async def update_sdvxin(async_session: async_sessionmaker[AsyncSession]):
-    bs4_features = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+async def update_sdvxin(
+    async_session: async_sessionmaker[AsyncSession], client: aiohttp.ClientSession
+):
     categories = [
         "pops",
         "niconico",
@@ -326,197 +385,233 @@ async def update_sdvxin(async_session: async_sessionmaker[AsyncSession]):
     }
     # sdvx.in ID, song_id, difficulty
     inserted_data: list[dict] = []
-    async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(total=600)
-    ) as client, async_session() as session, session.begin():
-        # standard categories
-        for category in categories:
+    semaphore = asyncio.Semaphore(10)
+    async with async_session() as session, session.begin():
+
+        async def fetch(url: str) -> str:
+            # The semaphore keeps us from opening every request at once;
+            # the connector pools keep-alive connections underneath.
+            async with semaphore:
+                resp = await client.get(url)
+                return await resp.text()
+
+        # Page and script fetches are independent, so overlap their
+        # round-trips with gather instead of awaiting them one by one.
+        # Only the database work at the end stays serial.
+        pages = await asyncio.gather(
+            *(
+                fetch(
+                    "https://sdvx.in/chunithm/end.htm"
+                    if category == "end"
+                    else f"https://sdvx.in/chunithm/sort/{category}.htm"
+                )
+                for category in categories
+            )
+        )
+
+        # (category, title, sdvx.in ID, script src)
+        chart_scripts: list[tuple[str, str, str, str]] = []
+        for category, page in zip(categories, pages):
             logger.info(f"Processing category {category}")
-            if category == "end":
-                url = "https://sdvx.in/chunithm/end.htm"
-            else:
-                url = f"https://sdvx.in/chunithm/sort/{category}.htm"
-            resp = await client.get(url)
-            soup = BeautifulSoup(await resp.text(), bs4_features)
+            root = lxml.html.fromstring(page)
 
-            tables = soup.select("table:has(td.tbgl)")
+            tables = TABLE_XPATH(root)
             if len(tables) == 0:
                 logger.error(f"Could not find table(s) for category {category}")
                 continue
 
             for table in tables:
-                scripts = table.select("script[src]")
+                scripts = SCRIPT_XPATH(table)
                 for script in scripts:
-                    title = next(
-                        (
-                            str(x)
-                            for x in script.next_elements
-                            if isinstance(x, Comment)
-                        ),
-                        None,
-                    )
-                    if title is None:
+                    comments = COMMENT_XPATH(script)
+                    if len(comments) == 0 or comments[0].text is None:
                         continue
+                    title = comments[0].text
                     title = title_mapping.get(title, unescape(title))
-                    sdvx_in_id = str(script["src"]).split("/")[-1][
+                    src = str(script.get("src"))
+                    sdvx_in_id = src.split("/")[-1][
                         :5
                     ]  # TODO: dont assume the ID is always 5 digits
+                    chart_scripts.append((category, title, sdvx_in_id, src))
 
-                    stmt = select(Song)
-                    condition = Song.title == title
-                    script_data = None
-                    if category == "end":
-                        script_resp = await client.get(
-                            f"https://sdvx.in{script['src']}"
-                        )
-                        script_data = await script_resp.text()
-
-                        match = WORLD_END_SDVXIN_REGEX.search(script_data)
-                        if (
-                            match is None
-                            or (level := match.group("difficulty")) is None
-                        ):
-                            logger.warning(
-                                f"Could not extract difficulty for {title}, {sdvx_in_id}"
-                            )
-                            continue
-
-                        stmt = stmt.join(Chart)
-                        condition &= (Song.id >= 8000) & (Chart.level == level)
-                    else:
-                        condition &= Song.id < 8000
-
-                    stmt = stmt.where(condition)
-                    song = (await session.execute(stmt)).scalar_one_or_none()
-                    if song is None:
-                        logger.warning(f"Could not find song with title {title}")
-                        continue
+        script_datas = await asyncio.gather(
+            *(fetch(f"https://sdvx.in{src}") for _, _, _, src in chart_scripts)
+        )
 
-                    if script_data is None:
-                        script_resp = await client.get(
-                            f"https://sdvx.in{script['src']}"
-                        )
-                        script_data = await script_resp.text()
+        for (category, title, sdvx_in_id, _), script_data in zip(
+            chart_scripts, script_datas
+        ):
+            stmt = select(Song)
+            condition = Song.title == title
+            if category == "end":
+                # The scripts can be hundreds of KB; find() the anchor first
+                # so the regex engine only runs where a match can start.
+                anchor = script_data.find("document.title")
+                match = (
+                    WORLD_END_SDVXIN_REGEX.search(script_data, anchor)
+                    if anchor != -1
+                    else None
+                )
+                if match is None or (level := match.group("difficulty")) is None:
+                    logger.warning(
+                        f"Could not extract difficulty for {title}, {sdvx_in_id}"
+                    )
+                    continue
 
-                    for line in script_data.splitlines():
-                        if not line.startswith(f"var LV{sdvx_in_id}"):
-                            continue
+                stmt = stmt.join(Chart)
+                condition &= (Song.id >= 8000) & (Chart.level == level)
+            else:
+                condition &= Song.id < 8000
 
-                        key, value = line.split("=", 1)
+            stmt = stmt.where(condition)
+            song = (await session.execute(stmt)).scalar_one_or_none()
+            if song is None:
+                logger.warning(f"Could not find song with title {title}")
+                continue
 
-                        # var LV00000W
-                        # var LV00000W2
-                        level = difficulties[key[11]]
-                        end_index = key[12] if len(key) > 12 else ""
+            prefix = f"var LV{sdvx_in_id}"
+            for line in script_data.splitlines():
+                if not line.startswith(prefix):
+                    continue
 
-                        value_soup = BeautifulSoup(
-                            value.removeprefix('"').removesuffix('";'), bs4_features
-                        )
-                        if value_soup.select_one("a") is None:
-                            continue
-                        inserted_data.append(
-                            {
-                                "id": sdvx_in_id,
-                                "song_id": song.id,
-                                "difficulty": level,
-                                "end_index": end_index,
-                            }
-                        )
+                key, value = line.split("=", 1)
+
+                # var LV00000W
+                # var LV00000W2
+                level = difficulties[key[11]]
+                end_index = key[12] if len(key) > 12 else ""
+
+                if A_TAG_REGEX.search(value) is None:
+                    continue
+                inserted_data.append(
+                    {
+                        "id": sdvx_in_id,
+                        "song_id": song.id,
+                        "difficulty": level,
+                        "end_index": end_index,
+                    }
+                )
 
-        stmt = insert(SdvxinChartView).values(inserted_data).on_conflict_do_nothing()
-        await session.execute(stmt)
+        stmt = insert(SdvxinChartView).on_conflict_do_nothing()
+        for batch in chunked(inserted_data):
+            await session.execute(stmt, batch)
 
 
-async def update_db(async_session: async_sessionmaker[AsyncSession]):
+async def update_db(
+    async_session: async_sessionmaker[AsyncSession], client: aiohttp.ClientSession
+):
     token = config.credentials.chunirec_token
     if token is None:
         msg = "credentials.chunirec_token"
         raise MissingConfiguration(msg)
 
-    async with aiohttp.ClientSession() as client:
-        resp = await client.get(
+    # The three catalogues are independent; overlap their round-trips.
+    resp, chuni_resp, zetaraku_resp = await asyncio.gather(
+        client.get(
             f"https://api.chunirec.net/2.0/music/showall.json?token={token}&region=jp2"
+        ),
+        client.get("https://chunithm.sega.jp/storage/json/music.json"),
+        client.get("https://dp4p6x0xfi5o9.cloudfront.net/chunithm/data.json"),
+    )
+    raw_songs, raw_chuni_songs, raw_zetaraku_songs = await asyncio.gather(
+        resp.read(), chuni_resp.read(), zetaraku_resp.read()
+    )
+
+    # Parse the raw bytes directly; orjson (if installed) skips the
+    # intermediate str that resp.json() would decode first.
+    songs: list[ChunirecSong] = json_loads(raw_songs)
+    chuni_songs: list[dict[str, str]] = json_loads(raw_chuni_songs)
+    zetaraku_songs: ZetarakuChunithmData = json_loads(raw_zetaraku_songs)
+
+    # Index the SEGA and zetaraku catalogues once so every chunirec song
+    # resolves with a dict lookup instead of rescanning (and renormalizing)
+    # both lists per song. setdefault keeps first-match-wins semantics.
+    chuni_index: dict[tuple[str, int], dict[str, str]] = {}
+    chuni_we_index: dict[str, dict[str, str]] = {}
+    chuni_artist_index: dict[tuple[str, str], dict[str, str]] = {}
+    for chunithm_song in chuni_songs:
+        norm_title = normalize_title(chunithm_song["title"])
+        # Unknown categories get -1, which no chunirec genre maps to, so
+        # they can never be matched by the genre probe below.
+        chuni_index.setdefault(
+            (norm_title, CHUNITHM_CATCODES.get(chunithm_song["catname"], -1)),
+            chunithm_song,
         )
-        chuni_resp = await client.get(
-            "https://chunithm.sega.jp/storage/json/music.json"
-        )
-        zetaraku_resp = await client.get(
-            "https://dp4p6x0xfi5o9.cloudfront.net/chunithm/data.json"
+        chuni_we_index.setdefault(
+            normalize_title(f"{chunithm_song['title']}【{chunithm_song['we_kanji']}】"),
+            chunithm_song,
         )
-        songs: list[ChunirecSong] = await resp.json(loads=json_loads)
-        chuni_songs: list[dict[str, str]] = await chuni_resp.json(loads=json_loads)
-        zetaraku_songs: ZetarakuChunithmData = await zetaraku_resp.json(
-            loads=json_loads
+        chuni_artist_index.setdefault(
+            (norm_title, normalize_title(chunithm_song["artist"])), chunithm_song
         )
 
+    zetaraku_index: dict[str, ZetarakuSong] = {}
+    for zetaraku_song in zetaraku_songs["songs"]:
+        zetaraku_index.setdefault(normalize_title(zetaraku_song["title"]), zetaraku_song)
+
     inserted_songs = []
-    inserted_charts = []
+    # Chart rows are collected as parallel column lists and only turned
+    # into dicts page by page at INSERT time, instead of allocating an
+    # 11-key dict per chart inside the hot loop.
+    chart_song_ids: list[int] = []
+    chart_difficulties: list[str] = []
+    chart_levels: list[str] = []
+    chart_consts: list[Optional[float]] = []
+    chart_maxcombos: list[Optional[int]] = []
+    chart_taps: list[Optional[int]] = []
+    chart_holds: list[Optional[int]] = []
+    chart_slides: list[Optional[int]] = []
+    chart_airs: list[Optional[int]] = []
+    chart_flicks: list[Optional[int]] = []
+    chart_charters: list[Optional[str]] = []
     for song in songs:
-        chunithm_id = -1
-        chunithm_catcode = -1
-        jacket = ""
-        chunithm_song: dict[str, str] = {}
-        try:
-            if song["meta"]["id"] in MANUAL_MAPPINGS:
-                chunithm_song = MANUAL_MAPPINGS[song["meta"]["id"]]
-            elif song["data"].get("WE") is None:
-                chunithm_song = next(
-                    x
-                    for x in chuni_songs
-                    if normalize_title(x["title"])
-                    == normalize_title(song["meta"]["title"])
-                    and CHUNITHM_CATCODES[x["catname"]]
-                    == CHUNITHM_CATCODES[song["meta"]["genre"]]
-                )
-            else:
-                chunithm_song = next(
-                    x
-                    for x in chuni_songs
-                    if normalize_title(f"{x['title']}【{x['we_kanji']}】")
-                    == normalize_title(song["meta"]["title"])
-                )
-            chunithm_id = int(chunithm_song["id"])
-            chunithm_catcode = int(CHUNITHM_CATCODES[chunithm_song["catname"]])
-            jacket = chunithm_song["image"]
-        except StopIteration:
-            logger.warning(f"Couldn't find {song['meta']}")
+        meta = song["meta"]
+        # Normalize once per song; the same title would otherwise be
+        # renormalized for every index probe below.
+        normalized_title = normalize_title(meta["title"])
+
+        chunithm_song: Optional[dict[str, str]]
+        if meta["id"] in MANUAL_MAPPINGS:
+            chunithm_song = MANUAL_MAPPINGS[meta["id"]]
+        elif song["data"].get("WE") is None:
+            chunithm_song = chuni_index.get(
+                (normalized_title, CHUNITHM_CATCODES[meta["genre"]])
+            )
+        else:
+            chunithm_song = chuni_we_index.get(normalized_title)
+
+        if chunithm_song is None:
+            logger.warning(f"Couldn't find {meta}")
             return
 
+        chunithm_id = int(chunithm_song["id"])
+        chunithm_catcode = int(CHUNITHM_CATCODES[chunithm_song["catname"]])
+        jacket = chunithm_song["image"]
+
         if not jacket:
-            chunithm_song = next(
+            chunithm_song = chuni_artist_index.get(
                 (
-                    x
-                    for x in chuni_songs
-                    if normalize_title(x["title"])
-                    == normalize_title(song["meta"]["title"], remove_we_kanji=True)
-                    and normalize_title(x["artist"])
-                    == normalize_title(song["meta"]["artist"])
+                    normalize_title(meta["title"], remove_we_kanji=True),
+                    normalize_title(meta["artist"]),
                 ),
                 {},
             )
             jacket = chunithm_song.get("image")
 
-        zetaraku_song = next(
-            (
-                x
-                for x in zetaraku_songs["songs"]
-                if normalize_title(x["title"]) == normalize_title(song["meta"]["title"])
-            ),
-            None,
-        )
+        zetaraku_song = zetaraku_index.get(normalized_title)
         zetaraku_jacket = (
             zetaraku_song["imageName"] if zetaraku_song is not None else ""
         )
 
         inserted_song = {
             "id": chunithm_id,
-            # Don't use song["meta"]["title"]
+            # Don't use meta["title"]
             "title": chunithm_song["title"],
             "chunithm_catcode": chunithm_catcode,
-            "genre": song["meta"]["genre"],
-            "artist": song["meta"]["artist"],
-            "release": song["meta"]["release"],
-            "bpm": None if song["meta"]["bpm"] == 0 else song["meta"]["bpm"],
+            "genre": meta["genre"],
+            "artist": meta["artist"],
+            "release": meta["release"],
+            "bpm": None if meta["bpm"] == 0 else meta["bpm"],
             "jacket": jacket,
             "zetaraku_jacket": zetaraku_jacket,
             "international_only": 0,
@@ -533,19 +628,11 @@ async def update_db(async_session: async_sessionmaker[AsyncSession]):
                     chart["const"] = chart["level"]
                     chart["is_const_unknown"] = 0
 
-                inserted_chart = {
-                    "song_id": chunithm_id,
-                    "difficulty": difficulty,
-                    "level": str(chart["level"]).replace(".5", "+").replace(".0", ""),
-                    "const": None if chart["is_const_unknown"] == 1 else chart["const"],
-                    "maxcombo": chart["maxcombo"] if chart["maxcombo"] != 0 else None,
-                    "tap": None,
-                    "hold": None,
-                    "slide": None,
-                    "air": None,
-                    "flick": None,
-                    "charter": None,
-                }
+                level = str(chart["level"]).replace(".5", "+").replace(".0", "")
+                const = None if chart["is_const_unknown"] == 1 else chart["const"]
+                maxcombo = chart["maxcombo"] if chart["maxcombo"] != 0 else None
+                tap = hold = slide = air = flick = None
+                charter = None
 
                 if (
                     zetaraku_song is not None
@@ -561,53 +648,55 @@ async def update_db(async_session: async_sessionmaker[AsyncSession]):
                     )
                     is not None
                 ):
-                    inserted_chart["charter"] = zetaraku_sheet["noteDesigner"]
-                    if inserted_chart["charter"] == "-":
-                        inserted_chart["charter"] = None
-
-                    total = 0
-                    should_add_notecounts = True
-                    for note_type in NOTE_TYPES:
-                        count = zetaraku_sheet["noteCounts"][note_type]
-                        if count is None and note_type != "flick":
-                            should_add_notecounts = False
-                            break
-
-                        inserted_chart[note_type] = count or 0
-                        total += count or 0
-
-                    if should_add_notecounts:
-                        inserted_chart["maxcombo"] = inserted_chart["maxcombo"] or total
-                    else:
-                        # Unset everything that was set
-                        for note_type in NOTE_TYPES:
-                            inserted_chart[note_type] = None
-
-                inserted_charts.append(inserted_chart)
+                    charter = zetaraku_sheet["noteDesigner"]
+                    if charter == "-":
+                        charter = None
+
+                    note_counts = zetaraku_sheet["noteCounts"]
+                    # flick is allowed to be missing; everything else must
+                    # be present for the counts to be trustworthy.
+                    if all(
+                        note_counts[note_type] is not None
+                        for note_type in NOTE_TYPES
+                        if note_type != "flick"
+                    ):
+                        counts = [
+                            note_counts[note_type] or 0 for note_type in NOTE_TYPES
+                        ]
+                        tap, hold, slide, air, flick = counts
+                        maxcombo = maxcombo or sum(counts)
+
+                chart_song_ids.append(chunithm_id)
+                chart_difficulties.append(difficulty)
+                chart_levels.append(level)
+                chart_consts.append(const)
+                chart_maxcombos.append(maxcombo)
+                chart_taps.append(tap)
+                chart_holds.append(hold)
+                chart_slides.append(slide)
+                chart_airs.append(air)
+                chart_flicks.append(flick)
+                chart_charters.append(charter)
 
         if (chart := song["data"].get("WE")) is not None:
-            we_stars = ""
-            for _ in range(-1, int(chunithm_song["we_star"]), 2):
-                we_stars += "☆"
-            inserted_charts.append(
-                {
-                    "song_id": chunithm_id,
-                    "difficulty": "WE",
-                    "level": chunithm_song["we_kanji"] + we_stars,
-                    "const": None,
-                    "maxcombo": chart["maxcombo"] if chart["maxcombo"] != 0 else None,
-                    "tap": None,
-                    "hold": None,
-                    "slide": None,
-                    "air": None,
-                    "flick": None,
-                    "charter": None,
-                }
-            )
+            we_stars = "☆" * ((int(chunithm_song["we_star"]) + 2) // 2)
+            chart_song_ids.append(chunithm_id)
+            chart_difficulties.append("WE")
+            chart_levels.append(chunithm_song["we_kanji"] + we_stars)
+            chart_consts.append(None)
+            chart_maxcombos.append(chart["maxcombo"] if chart["maxcombo"] != 0 else None)
+            chart_taps.append(None)
+            chart_holds.append(None)
+            chart_slides.append(None)
+            chart_airs.append(None)
+            chart_flicks.append(None)
+            chart_charters.append(None)
 
     async with async_session() as session, session.begin():
-        insert_statement = insert(Song).values(inserted_songs)
-        upsert_statement = insert_statement.on_conflict_do_update(
+        # Upsert statements are built once and reused across pages, so
+        # SQLAlchemy only compiles each conflict clause a single time.
+        insert_statement = insert(Song)
+        song_upsert = insert_statement.on_conflict_do_update(
             index_elements=[Song.id],
             set_={
                 "title": insert_statement.excluded.title,
@@ -622,10 +711,51 @@ async def update_db(async_session: async_sessionmaker[AsyncSession]):
                 ),
             },
         )
-        await session.execute(upsert_statement)
-
-        insert_statement = insert(Chart).values(inserted_charts)
-        upsert_statement = insert_statement.on_conflict_do_update(
+        for batch in chunked(inserted_songs):
+            await session.execute(song_upsert, batch)
+
+        inserted_charts = [
+            {
+                "song_id": song_id,
+                "difficulty": difficulty,
+                "level": level,
+                "const": const,
+                "maxcombo": maxcombo,
+                "tap": tap,
+                "hold": hold,
+                "slide": slide,
+                "air": air,
+                "flick": flick,
+                "charter": charter,
+            }
+            for (
+                song_id,
+                difficulty,
+                level,
+                const,
+                maxcombo,
+                tap,
+                hold,
+                slide,
+                air,
+                flick,
+                charter,
+            ) in zip(
+                chart_song_ids,
+                chart_difficulties,
+                chart_levels,
+                chart_consts,
+                chart_maxcombos,
+                chart_taps,
+                chart_holds,
+                chart_slides,
+                chart_airs,
+                chart_flicks,
+                chart_charters,
+            )
+        ]
+        insert_statement = insert(Chart)
+        chart_upsert = insert_statement.on_conflict_do_update(
             index_elements=[Chart.song_id, Chart.difficulty],
             set_={
                 "level": insert_statement.excluded.level,
@@ -643,100 +773,124 @@ async def update_db(async_session: async_sessionmaker[AsyncSession]):
                 ),
             },
         )
-        await session.execute(upsert_statement)
+        for batch in chunked(inserted_charts):
+            await session.execute(chart_upsert, batch)
+
+
+def parse_music_dir(item: Path) -> tuple[int, list[dict]]:
+    """Parses a dump directory's Music.xml and chart CSVs.
+
+    Synchronous on purpose: it runs in a worker thread so the blocking
+    etree/csv work never stalls the event loop.
+    """
+    tree = etree.parse(str(item / "Music.xml"))
+    root = tree.getroot()
+
+    chunithm_id = int(str(MUSIC_ID_XPATH(root)[0]))
+    charts: list[dict] = []
+
+    for chart in MUSIC_FUMENS_XPATH(root):
+        types = FUMEN_TYPE_XPATH(chart)
+        if len(types) == 0:
+            continue
+        difficulty = str(types[0])
+
+        if difficulty != "WORLD'S END":
+            level: str = str(FUMEN_LEVEL_XPATH(chart)[0])
+            level_decimal: str = str(FUMEN_LEVEL_DECIMAL_XPATH(chart)[0])
+
+            values: dict = {
+                "level": level + ("+" if int(level_decimal) >= 50 else ""),
+                "const": float(f"{level}.{level_decimal}"),
+            }
+        else:
+            we_tag: str = str(MUSIC_WE_TAG_XPATH(root)[0])
+            we_stars: int = int(str(MUSIC_WE_STARS_XPATH(root)[0]))
+
+            values = {
+                "level": we_tag + "☆" * ((we_stars + 2) // 2),
+                "const": None,
+            }
+
+        bpm: Optional[int] = None
+        chart_file: Path = item / str(FUMEN_FILE_XPATH(chart)[0])
+
+        with chart_file.open() as f:
+            rd = csv.reader(f, delimiter="\t")
+            for row in rd:
+                if len(row) == 0:
+                    continue
+
+                command = row[0]
+                if (attr := CHART_CSV_ATTRS.get(command)) is not None:
+                    values[attr] = int(row[1])
+                elif command == "CREATOR":
+                    values["charter"] = row[1]
+                elif command == "BPM_DEF":
+                    bpm = int(float(row[1]))
+
+        charts.append({"difficulty": difficulty, "bpm": bpm, "values": values})
+
+    return chunithm_id, charts
 
 
 async def update_cc_from_data(
     async_session: async_sessionmaker[AsyncSession], music_paths: list[Path]
 ):
-    async def thread(item: Path, semaphore: asyncio.BoundedSemaphore):
-        async with semaphore, asyncio.TaskGroup() as tg, async_session() as session, session.begin():
-            tree = ElementTree.parse(item / "Music.xml")
-            root = tree.getroot()
+    async def process_item(item: Path, session: AsyncSession):
+        chunithm_id, charts = await asyncio.to_thread(parse_music_dir, item)
 
-            chunithm_id = int(root.find("./name/id").text)  # type: ignore[reportOptionalMemberAccess]
+        stmt = (
+            select(Song).where(Song.id == chunithm_id).options(joinedload(Song.charts))
+        )
+        song: Song = (await session.execute(stmt)).unique().scalar_one_or_none()
 
-            stmt = (
-                select(Song)
-                .where(Song.id == chunithm_id)
-                .options(joinedload(Song.charts))
-            )
-            song: Song = (await session.execute(stmt)).unique().scalar_one_or_none()
+        if song is None:
+            logger.warning(f"Could not find song with chunithm_id {chunithm_id}")
+            return
 
-            if song is None:
-                logger.warning(f"Could not find song with chunithm_id {chunithm_id}")
-                return
+        for parsed in charts:
+            difficulty = parsed["difficulty"]
+            db_chart = next(
+                (
+                    chart
+                    for chart in song.charts
+                    if chart.difficulty == difficulty[:3]
+                    or (chart.difficulty == "WE" and difficulty == "WORLD'S END")
+                ),
+                None,
+            )
 
-            for chart in root.findall("./fumens/MusicFumenData[enable='true']"):
-                difficulty = chart.find("./type/data").text  # type: ignore[reportOptionalMemberAccess]
-                if difficulty is None:
-                    continue
+            if db_chart is None:
+                continue
 
-                db_chart = next(
-                    (
-                        chart
-                        for chart in song.charts
-                        if chart.difficulty == difficulty[:3]
-                        or (chart.difficulty == "WE" and difficulty == "WORLD'S END")
-                    ),
-                    None,
-                )
+            # song and db_chart are already attached to the session, so
+            # mutating them is enough; the unit of work flushes every
+            # dirty row in one batch when the transaction commits.
+            if parsed["bpm"] is not None and song.bpm is None:
+                song.bpm = parsed["bpm"]
 
-                if db_chart is None:
-                    continue
+            for attr, value in parsed["values"].items():
+                setattr(db_chart, attr, value)
 
-                if db_chart.difficulty != "WE":
-                    level: str = chart.find("./level").text  # type: ignore[reportOptionalMemberAccess]
-                    level_decimal: str = chart.find("./levelDecimal").text  # type: ignore[reportOptionalMemberAccess]
-
-                    db_chart.level = level + ("+" if int(level_decimal) >= 50 else "")
-                    db_chart.const = float(f"{level}.{level_decimal}")
-                else:
-                    we_tag: str = root.find("./worldsEndTagName/str").text  # type: ignore[reportOptionalMemberAccess]
-                    we_stars: int = int(root.find("./starDifType").text)  # type: ignore[reportOptionalMemberAccess]
-
-                    db_chart.const = None
-                    db_chart.level = we_tag
-                    for _ in range(-1, we_stars, 2):
-                        db_chart.level += "☆"
-
-                chart_file: Path = item / chart.find("./file/path").text  # type: ignore[reportOptionalMemberAccess]
-
-                with chart_file.open() as f:
-                    rd = csv.reader(f, delimiter="\t")
-                    for row in rd:
-                        if len(row) == 0:
-                            continue
-
-                        command = row[0]
-                        if command == "BPM_DEF" and song.bpm is None:
-                            song.bpm = int(float(row[1]))
-                            tg.create_task(session.merge(song))
-                        if command == "T_JUDGE_ALL":
-                            db_chart.maxcombo = int(row[1])
-                        if command == "T_JUDGE_TAP":
-                            db_chart.tap = int(row[1])
-                        if command == "T_JUDGE_HLD":
-                            db_chart.hold = int(row[1])
-                        if command == "T_JUDGE_SLD":
-                            db_chart.slide = int(row[1])
-                        if command == "T_JUDGE_AIR":
-                            db_chart.air = int(row[1])
-                        if command == "T_JUDGE_FLK":
-                            db_chart.flick = int(row[1])
-                        if command == "CREATOR":
-                            db_chart.charter = row[1]
-
-                tg.create_task(session.merge(db_chart))
+    async def process_batch(items: list[Path], semaphore: asyncio.BoundedSemaphore):
+        # One session/transaction per batch: SQLite pays an fsync per
+        # commit, so committing per song makes the commits, not the
+        # writes, the bottleneck.
+        async with semaphore, async_session() as session, session.begin():
+            for item in items:
+                await process_item(item, session)
 
     semaphore = asyncio.BoundedSemaphore(10)
-    futures = [
-        thread(item, semaphore)
+    items = [
+        item
         for music_path in music_paths
         for item in music_path.iterdir()
         if item.is_dir()
     ]
-    await asyncio.gather(*futures)
+    await asyncio.gather(
+        *(process_batch(batch, semaphore) for batch in chunked(items, 100))
+    )
 
 
 async def main():
@@ -772,20 +926,30 @@ async def main():
 
     if args.command == "update":
         async_session = async_sessionmaker(engine, expire_on_commit=False)
-        if args.source == "chunirec":
-            await update_db(async_session)
-        if args.source == "sdvxin":
-            await update_sdvxin(async_session)
-        if args.source == "alias":
-            await update_aliases(async_session)
-        if args.source == "dump":
-            await update_cc_from_data(async_session, args.paths)
+        # One session for every source, so back-to-back updates reuse the
+        # connection pool, DNS cache and TLS sessions.
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=600),
+        ) as client:
+            if args.source == "chunirec":
+                await update_db(async_session, client)
+            if args.source == "sdvxin":
+                await update_sdvxin(async_session, client)
+            if args.source == "alias":
+                await update_aliases(async_session, client)
+            if args.source == "dump":
+                await update_cc_from_data(async_session, args.paths)
 
     await engine.dispose()
 
 
 if __name__ == "__main__":
-    import asyncio
     import sys
 
     event_loop_impl = None
@@ -84,6 +84,7 @@ class QueueListenerHandler(logging.handlers.QueueHandler):
         self._listener = logging.handlers.QueueListener(
             self.queue,
             *handlers,
+            respect_handler_level=True,
         )
 
         self._listener.start()